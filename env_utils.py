@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared .env loader for the monitor and the Telegram helper scripts
+"""
+
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# KEY=value lines; values may be quoted and followed by a # comment. An
+# unquoted value only ends at a # preceded by whitespace (as in dotenv),
+# so tokens containing '#' are kept whole
+_ENV_RE = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'(?:"([^"\n]*)"[ \t]*(?:#[^\n]*)?'
+    r'|\'([^\'\n]*)\'[ \t]*(?:#[^\n]*)?'
+    r'|([^\n]*?)(?:[ \t]+#[^\n]*)?)[ \t]*\r?$',
+    re.M
+)
+
+# Load environment variables from .env file; skipped when every name in
+# `required` is already set by the real environment (PM2, systemd, ...)
+def load_env_file(path='.env', required=()):
+    if required and all(os.environ.get(name) for name in required):
+        return
+    try:
+        with open(path, 'rb') as f:
+            data = f.read().decode()
+    except FileNotFoundError:
+        logger.warning("Warning: .env file not found")
+        return
+    os.environ.update({
+        key: dq or sq or raw for key, dq, sq, raw in _ENV_RE.findall(data)
+    })
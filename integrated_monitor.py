@@ -5,27 +5,52 @@ Integrated Monitor - Binance & Bybit & Hyperliquid
 Real-time liquidation tracker for cryptocurrency exchanges
 """
 
+from __future__ import annotations
+
 import json
 import time
 import threading
+import queue
 import websocket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import re
-import asyncio
-from datetime import datetime, timezone
+import functools
+import atexit
+import logging
+import logging.handlers
+import sys
+
+from env_utils import load_env_file
+from tg_client import run_async
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+logger = logging.getLogger("integrated_monitor")
+
+def setup_logging():
+    """Log through a queue so monitor threads never block on stdout writes"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
 
 # Load environment variables from .env file
-def load_env_file():
-    try:
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-    except FileNotFoundError:
-        print("Warning: .env file not found")
-
 load_env_file()
 
 # Configuration
@@ -38,108 +63,251 @@ TELEGRAM_API_HASH = os.getenv('TELEGRAM_API_HASH')
 HYPERLIQUID_CHANNEL = 'hyperliquid_liquidations'  # Canal a ser monitorado
 
 # Special tracked symbols
-TRACKED_SYMBOLS = {"BTCUSDT", "ETHUSDT", "ETHUSDC", "SOLUSDT"}
+TRACKED_SYMBOLS = frozenset({"BTCUSDT", "ETHUSDT", "ETHUSDC", "SOLUSDT"})
 SYMBOL_COLORS = {"BTC": "🟠", "ETH": "🔵", "SOL": "🟣"}
 
-def send_telegram(message: str):
-    """Send message to Telegram"""
+HEALTH_CHECK_INTERVAL = 300  # seconds between connection/thread health checks
+
+# Bybit allLiquidation topics (USDT linear perpetuals among TRACKED_SYMBOLS)
+BYBIT_SYMBOLS = sorted(s for s in TRACKED_SYMBOLS if s.endswith("USDT"))
+
+# Binance/Bybit alert thresholds (USD notional)
+SPECIAL_THRESHOLD = 1_000_000  # TRACKED_SYMBOLS
+GENERIC_THRESHOLD = 500_000  # everything else
+
+# A notional whose qty and price have this many integer digits between them
+# is below 10 ** digits, which can't reach GENERIC_THRESHOLD
+_MAX_REJECT_DIGITS = len(str(GENERIC_THRESHOLD)) - 1
+
+# Integer digits of qty and price in a raw Binance forceOrder frame; frames
+# that don't match (unexpected layout) just take the decode path. Bytes
+# pattern: with skip_utf8_validation=True websocket-client hands text
+# frames to on_message undecoded
+_BINANCE_QP_RE = re.compile(rb'"q":"(\d*)[.\d]*","p":"(\d*)')
+
+# Same for the size/price pairs in a Bybit allLiquidation frame
+_BYBIT_VP_RE = re.compile(rb'"v":"(\d*)[.\d]*","p":"(\d*)')
+
+def below_generic_threshold(qty_str: str, price_str: str) -> bool:
+    """Cheap pre-check on the raw decimal strings, before any float parsing"""
+    q_digits = qty_str.find('.')
+    if q_digits < 0:
+        q_digits = len(qty_str)
+    p_digits = price_str.find('.')
+    if p_digits < 0:
+        p_digits = len(price_str)
+    return q_digits + p_digits <= _MAX_REJECT_DIGITS
+
+# Telegram sender: alerts are queued and posted by a background worker so
+# the WebSocket callbacks never wait on the HTTPS round-trip
+TELEGRAM_MAX_LENGTH = 3800  # stays clear of the 4096-char sendMessage limit
+TELEGRAM_BATCH_WINDOW = 0.5  # seconds to wait for more alerts to coalesce
+TELEGRAM_SEPARATOR = "\n➖➖➖\n"  # rule between coalesced alerts
+TELEGRAM_BATCH_SIZE = 10  # max alerts per coalesced message
+TELEGRAM_QUEUE_SIZE = 1024  # alerts beyond this backlog are dropped
+_tg_queue = queue.Queue(maxsize=TELEGRAM_QUEUE_SIZE)
+
+# One keep-alive session so alerts reuse the warm TLS connection
+_TG_URL = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+_tg_session = requests.Session()
+_tg_session.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    # POST is retried only where Telegram can't have accepted the message:
+    # connect errors and 429 (honouring Retry-After). Read errors and 5xx
+    # may come after sendMessage went through, so retrying would duplicate
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False
+    )
+))
+_tg_session.headers["Content-Type"] = "application/json"
+
+# sendMessage body up to the text field, serialized once
+_TG_BODY_PREFIX = b'{"chat_id":' + _dumps(CHAT_ID) + b',"parse_mode":"MarkdownV2","text":'
+
+def _post_telegram(message: str):
+    """Post a message to Telegram, returning the HTTP status (None on exception)"""
     try:
-        url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-        resp = requests.post(url, json={
-            "chat_id": CHAT_ID,
-            "text": message,
-            "parse_mode": "MarkdownV2"
-        }, timeout=10)
+        body = _TG_BODY_PREFIX + _dumps(message) + b'}'
+        resp = _tg_session.post(_TG_URL, data=body, timeout=10)
         if resp.status_code == 200:
-            print(f"✅ Telegram: {message[:50]}...")
+            logger.info(f"✅ Telegram: {message[:50]}...")
         else:
-            print(f"❌ Telegram Error: {resp.status_code}")
+            logger.error(f"❌ Telegram Error: {resp.status_code} {resp.text[:200]}")
+        return resp.status_code
     except Exception as e:
-        print(f"❌ Telegram Exception: {e}")
+        logger.error(f"❌ Telegram Exception: {e}")
+        return None
+
+def _telegram_worker():
+    """Drain the alert queue, coalescing bursts into a single message"""
+    pending = None
+    while True:
+        batch = [pending if pending is not None else _tg_queue.get()]
+        pending = None
+        length = len(batch[0])
+        deadline = time.monotonic() + TELEGRAM_BATCH_WINDOW
+        while len(batch) < TELEGRAM_BATCH_SIZE:
+            try:
+                message = _tg_queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if length + len(TELEGRAM_SEPARATOR) + len(message) > TELEGRAM_MAX_LENGTH:
+                pending = message  # Starts the next batch
+                break
+            batch.append(message)
+            length += len(TELEGRAM_SEPARATOR) + len(message)
+        status = _post_telegram(TELEGRAM_SEPARATOR.join(batch))
+        # A 4xx means Telegram rejected the whole batch (typically one alert
+        # with bad MarkdownV2), so resend the alerts one by one to deliver the
+        # rest. 429 was already retried, and 5xx may follow a delivered batch
+        if len(batch) > 1 and status is not None and 400 <= status < 500 and status != 429:
+            for message in batch:
+                _post_telegram(message)
+
+def start_telegram_sender():
+    """Start the background Telegram sender thread"""
+    threading.Thread(target=_telegram_worker, daemon=True).start()
+
+def send_telegram(message: str):
+    """Queue message for Telegram without blocking the caller"""
+    try:
+        _tg_queue.put_nowait(message)
+    except queue.Full:
+        logger.warning(f"⚠️ Telegram queue full, dropping: {message[:50]}...")
+
+# MarkdownV2 reserved characters, escaped in a single str.translate pass
+_MD2_TABLE = str.maketrans({ch: f"\\{ch}" for ch in r"\_*[]()~`>#+-=|{}.!"})
 
 def md_escape(text: str) -> str:
     """Escape characters for MarkdownV2"""
-    for ch in r"\_*[]()~`>#+-=|{}.!":
-        text = text.replace(ch, f"\\{ch}")
-    return text
+    return text.translate(_MD2_TABLE)
+
+MAX_SKULLS = 50  # keeps a freak print from producing a huge header
+
+@functools.lru_cache(maxsize=MAX_SKULLS + 1)
+def _skulls_n(n: int) -> str:
+    return "💀" * n
 
 def skulls(value: float, step: int = 1_000_000) -> str:
-    return "💀" * int(value // step)
+    if value < step:
+        return ""
+    return _skulls_n(min(int(value) // step, MAX_SKULLS))
 
 def format_value_compact(value: float) -> str:
     """Format value in compact format: $2.16M, $542.3k"""
+    # Whole dollars are plenty for 2/1-decimal M/k display; round half up
     if value >= 1_000_000:
-        return f"${round(value / 1_000_000, 2):.2f}M"
+        n = (int(value) + 5_000) // 10_000
+        return f"${n // 100}.{n % 100:02d}M"
     elif value >= 1_000:
-        return f"${round(value / 1_000, 1):.1f}k"
+        n = (int(value) + 50) // 100
+        return f"${n // 10}.{n % 10}k"
     else:
         return f"${value:.2f}"
 
-def base_format(symbol, side, value, price, exchange_tag):
-    """Format for special symbols (BTC, ETH, SOL)"""
-    asset = symbol.replace("USDT", "").replace("USDC", "")
-    emoji = SYMBOL_COLORS.get(asset, "")
-    position = "SHORT" if side == "BUY" or side == "Buy" else "LONG"
+# Exchange tags
+BINANCE_TAG = "🔶 Binance"
+BYBIT_TAG = "🟨 Bybit"
+
+# A liquidated BUY order closes a short (Binance "BUY", Bybit "Buy")
+_POSITION = {"BUY": "SHORT", "Buy": "SHORT"}
+
+_HYPERLIQUID_HEADER = "💦 *Hyperliquid Liquidation\\!*\n"
+
+# Coloured "$ASSET" display per asset and per tracked symbol,
+# e.g. "ETH" and "ETHUSDC" -> "🔵$ETH"
+_ASSET_DISPLAY = {asset: f"{emoji}${asset}" for asset, emoji in SYMBOL_COLORS.items()}
+_SYMBOL_DISPLAY = {
+    symbol: _ASSET_DISPLAY.get(symbol[:-4], f"${symbol[:-4]}") for symbol in TRACKED_SYMBOLS
+}
+
+@functools.lru_cache(maxsize=512)
+def _alert_head(symbol: str, side: str, exchange_tag: str, special: bool) -> str:
+    """Header and position line, which repeat across a liquidation cascade"""
+    display = _SYMBOL_DISPLAY[symbol] if special else f"${md_escape(symbol)}"
+    return f"*{md_escape(exchange_tag)} Liquidation\\!*\n{_POSITION.get(side, 'LONG')} {display}\n"
+
+def _format_alert(symbol: str, side: str, value: float, price: float,
+                  exchange_tag: str, special: bool) -> str:
     v_fmt = md_escape(format_value_compact(value))
     p_fmt = md_escape(f"{price:,.2f}")
-    
     skull_line = skulls(value)
-    if skull_line:
-        return (
-            f"{skull_line}\n"
-            f"*{exchange_tag} Liquidation\\!*\n"
-            f"{position} {emoji}${asset}\n"
-            f"*{v_fmt} @ {p_fmt}*"
-        )
-    else:
-        return (
-            f"*{exchange_tag} Liquidation\\!*\n"
-            f"{position} {emoji}${asset}\n"
-            f"*{v_fmt} @ {p_fmt}*"
-        )
+    skull_prefix = f"{skull_line}\n" if skull_line else ""
+    return f"{skull_prefix}{_alert_head(symbol, side, exchange_tag, special)}*{v_fmt} @ {p_fmt}*"
 
-def generic_format(symbol, side, value, price, exchange_tag):
+def base_format(symbol: str, side: str, value: float, price: float, exchange_tag: str) -> str:
+    """Format for special symbols (BTC, ETH, SOL)"""
+    return _format_alert(symbol, side, value, price, exchange_tag, True)
+
+def generic_format(symbol: str, side: str, value: float, price: float, exchange_tag: str) -> str:
     """Format for other symbols (above 500k)"""
-    position = "SHORT" if side == "BUY" or side == "Buy" else "LONG"
-    s = md_escape(symbol)
-    v_fmt = md_escape(format_value_compact(value))
-    p_fmt = md_escape(f"{price:,.2f}")
-    
-    skull_line = skulls(value)
-    if skull_line:
-        return (
-            f"{skull_line}\n"
-            f"*{exchange_tag} Liquidation\\!*\n"
-            f"{position} ${s}\n"
-            f"*{v_fmt} @ {p_fmt}*"
-        )
+    return _format_alert(symbol, side, value, price, exchange_tag, False)
+
+# Pattern to match: 🔴/🟢 #SYMBOL Long/Short Liquidation: $VALUE @ $PRICE
+# Handles both 🔴 (Long) and 🟢 (Short) liquidations
+_HL_PATTERN = re.compile(
+    r'[🔴🟢]\s*#(\w+)\s+(Long|Short)\s+Liquidation:\s*\$([0-9,.kM]+)\s*@\s*\$([0-9,.]+)'
+)
+
+def _split_hyperliquid(message_text: str) -> tuple[str, str, str, str] | None:
+    """Slice the canonical '🔴 #SYM Long Liquidation: $VALUE @ $PRICE' layout.
+
+    Returns (symbol, side, value_str, price_str), or None as soon as the text
+    strays from single-space canonical form, leaving it to _HL_PATTERN.
+    """
+    hash_at = message_text.find('#')
+    if hash_at < 2 or not message_text.startswith(('🔴 #', '🟢 #'), hash_at - 2):
+        return None
+    sym_end = message_text.find(' ', hash_at)
+    symbol = message_text[hash_at + 1:sym_end]
+    if sym_end < 0 or not symbol.isascii() or not symbol.isalnum():
+        return None
+    if message_text.startswith('Long Liquidation: $', sym_end + 1):
+        side = 'Long'
+    elif message_text.startswith('Short Liquidation: $', sym_end + 1):
+        side = 'Short'
     else:
-        return (
-            f"*{exchange_tag} Liquidation\\!*\n"
-            f"{position} ${s}\n"
-            f"*{v_fmt} @ {p_fmt}*"
-        )
-
-def parse_hyperliquid_message(message_text):
+        return None
+    value_start = sym_end + 1 + len(side) + len(' Liquidation: $')
+    value_end = message_text.find(' @ $', value_start)
+    if value_end < 0:
+        return None
+    value_str = message_text[value_start:value_end]
+    price_end = message_text.find(' ', value_end + 4)
+    price_str = message_text[value_end + 4:price_end if price_end >= 0 else None]
+    if (not value_str or value_str.strip('0123456789,.kM')
+            or not price_str or price_str.strip('0123456789,.')):
+        return None
+    return symbol, side, value_str, price_str
+
+# Value suffix -> (multiplier, slice end); thousands separators are
+# stripped with one translate pass
+_VALUE_SUFFIX = {'k': (1000, -1), 'M': (1_000_000, -1)}
+_COMMA_STRIP_TBL = str.maketrans('', '', ',')
+
+def parse_hyperliquid_message(message_text: str) -> dict | None:
     """Parse Hyperliquid liquidation message and extract relevant data"""
-    # Pattern to match: 🔴/🟢 #SYMBOL Long/Short Liquidation: $VALUE @ $PRICE
-    # Updated to handle both 🔴 (Long) and 🟢 (Short) liquidations
-    pattern = r'[🔴🟢]\s*#(\w+)\s+(Long|Short)\s+Liquidation:\s*\$([0-9,.kM]+)\s*@\s*\$([0-9,.]+)'
-    
-    match = re.search(pattern, message_text)
-    if match:
-        symbol = match.group(1)      # SOL, ETH, ENA, BTC, etc
-        side = match.group(2)        # Long, Short  
-        value_str = match.group(3)   # 76.63k, 79.75k, 23.44M, etc
-        price_str = match.group(4)   # 179.50, 3764.0, 117,078.5, etc
+    fields = _split_hyperliquid(message_text)
+    if fields is None:
+        match = _HL_PATTERN.search(message_text)
+        if match:
+            fields = match.groups()
+    if fields:
+        symbol, side, value_str, price_str = fields
+        # symbol: SOL, ETH, ENA, BTC, etc
+        # side: Long, Short
+        # value_str: 76.63k, 79.75k, 23.44M, etc
+        # price_str: 179.50, 3764.0, 117,078.5, etc
         
         # Convert value from string (handle 'k' and 'M' suffixes)
-        if value_str.endswith('M'):
-            value = float(value_str.replace('M', '').replace(',', '')) * 1_000_000
-        elif value_str.endswith('k'):
-            value = float(value_str.replace('k', '').replace(',', '')) * 1000
-        else:
-            value = float(value_str.replace(',', ''))
+        mult, end = _VALUE_SUFFIX.get(value_str[-1:], (1, None))
+        value = float(value_str[:end].translate(_COMMA_STRIP_TBL)) * mult
             
         return {
             'symbol': symbol,
@@ -158,41 +326,21 @@ def format_hyperliquid_message(parsed_data):
     price = parsed_data['price']
     value = parsed_data['value']
     
-    # Apply symbol colors and formatting based on your examples
-    if symbol == 'SOL':
-        symbol_display = '🟣$SOL'
-    elif symbol == 'ETH':
-        symbol_display = '🔵$ETH'
-    elif symbol == 'BTC':
-        symbol_display = '🟠$BTC'
-    else:
-        # For other symbols like ENA, keep as is without USDT suffix
-        symbol_display = f'${symbol}'
-    
-    # Calculate skulls (1 skull per 1 million)
-    skulls_count = int(value // 1_000_000)
-    skull_line = "💀" * skulls_count if skulls_count > 0 else ""
+    # Coloured display for BTC/ETH/SOL; other symbols like ENA as $ENA
+    symbol_display = _ASSET_DISPLAY.get(symbol) or f"${md_escape(symbol)}"
     
     # Escape special characters for MarkdownV2
     value_escaped = md_escape(f"${value_display}")
     price_escaped = md_escape(f"${price}")
     
-    # Format with skulls if applicable
-    if skull_line:
-        formatted = (
-            f"{skull_line}\n"
-            f"💦 *Hyperliquid Liquidation\\!*\n"
-            f"{side} {symbol_display}\n"
-            f"*{value_escaped} @ {price_escaped}*"
-        )
-    else:
-        formatted = (
-            f"💦 *Hyperliquid Liquidation\\!*\n"
-            f"{side} {symbol_display}\n"
-            f"*{value_escaped} @ {price_escaped}*"
-        )
-    
-    return formatted
+    # 1 skull per 1 million
+    skull_line = skulls(value)
+    skull_prefix = f"{skull_line}\n" if skull_line else ""
+    return (
+        f"{skull_prefix}{_HYPERLIQUID_HEADER}"
+        f"{side} {symbol_display}\n"
+        f"*{value_escaped} @ {price_escaped}*"
+    )
 
 def test_hyperliquid_parsing():
     """Test function to verify parsing works with real examples"""
@@ -204,101 +352,147 @@ def test_hyperliquid_parsing():
         "🟢 #ETH Short Liquidation: $160.42k @ $3,806.3 [scan][dash]"
     ]
     
-    print("🧪 Testando parser da Hyperliquid...")
+    logger.info("🧪 Testando parser da Hyperliquid...")
     for i, msg in enumerate(test_messages, 1):
-        print(f"\n--- Teste {i} ---")
-        print(f"Input: {msg[:100]}...")
+        logger.info(f"\n--- Teste {i} ---")
+        logger.info(f"Input: {msg[:100]}...")
         
         parsed = parse_hyperliquid_message(msg)
         if parsed:
-            print(f"✅ Parsed: {parsed}")
+            logger.info(f"✅ Parsed: {parsed}")
             formatted = format_hyperliquid_message(parsed)
-            print(f"📤 Output: {formatted}")
+            logger.info(f"📤 Output: {formatted}")
             
             # Test filter
             value = parsed['value']
             if value >= 1_000_000:
-                print(f"✅ Filtro: Passou (${value:,.2f} >= $1M)")
+                logger.info(f"✅ Filtro: Passou (${value:,.2f} >= $1M)")
             else:
-                print(f"❌ Filtro: Bloqueado (${value:,.2f} < $1M)")
+                logger.info(f"❌ Filtro: Bloqueado (${value:,.2f} < $1M)")
         else:
-            print("❌ Parsing falhou")
+            logger.error("❌ Parsing falhou")
     
-    print("\n🧪 Teste concluído\n")
+    logger.info("\n🧪 Teste concluído\n")
+
+def test_exchange_frames():
+    """Feed raw bytes frames, as websocket-client delivers them, through on_message"""
+    global send_telegram
+    binance_frame = (b'{"e":"forceOrder","E":1,"o":{"s":"%s","S":"BUY","o":"LIMIT",'
+                     b'"f":"IOC","q":"%s","p":"%s","ap":"%s","X":"FILLED"}}')
+    bybit_frame = b'{"topic":"allLiquidation.X","type":"snapshot","ts":1,"data":[%s]}'
+    cases = [
+        (BinanceMonitor, binance_frame % (b"BTCUSDT", b"12.000", b"100000.00", b"100000.00"), 1),
+        (BinanceMonitor, binance_frame % (b"XRPUSDT", b"900000", b"0.6000", b"0.6000"), 1),
+        (BinanceMonitor, binance_frame % (b"BTCUSDT", b"0.003", b"100000.00", b"100000.00"), 0),
+        (BybitMonitor, bybit_frame % (
+            b'{"T":1,"s":"ETHUSDT","S":"Sell","v":"500.00","p":"2500.00"},'
+            b'{"T":1,"s":"ETHUSDT","S":"Sell","v":"0.01","p":"2500.00"}'), 1),
+        (BybitMonitor, bybit_frame % (
+            b'{"T":1,"s":"SOLUSDT","S":"Buy","v":"3.5","p":"150.00"},'
+            b'{"T":1,"s":"SOLUSDT","S":"Buy","v":"12","p":"150.00"}'), 0),
+    ]
+
+    logger.info("🧪 Testando frames das exchanges...")
+    sent = []
+    real_send = send_telegram
+    send_telegram = sent.append
+    try:
+        for i, (monitor_cls, frame, expected) in enumerate(cases, 1):
+            sent.clear()
+            monitor_cls().on_message(None, frame)
+            if len(sent) == expected:
+                logger.info(f"✅ Frame {i}: {expected} alerta(s)")
+            else:
+                logger.error(f"❌ Frame {i}: {len(sent)} alerta(s), esperado {expected}")
+    finally:
+        send_telegram = real_send
+
+def reconnect_delay(attempt: int) -> int:
+    """Exponential backoff between reconnect attempts: 2s, 4s, 8s... capped at 60s"""
+    return min(60, 2 ** attempt)
 
 class BinanceMonitor:
+    __slots__ = ('ws', 'running', 'reconnect_count', 'max_reconnect_attempts')
+
     def __init__(self):
         self.ws = None
         self.running = False
         self.reconnect_count = 0
         self.max_reconnect_attempts = 10
 
-    def on_message(self, ws, message):
+    def on_message(self, ws, message: bytes) -> None:
         try:
-            data = json.loads(message)
-            order = data.get('o', {})
-            symbol = order.get('s')
-            side = order.get('S')
-            qty = float(order.get('q', 0))
-            price = float(order.get('p', 0))
-            value = qty * price
+            # Most forceOrder frames are tiny; reject them from the raw
+            # text before paying for the JSON decode
+            raw = _BINANCE_QP_RE.search(message)
+            if raw and len(raw[1]) + len(raw[2]) <= _MAX_REJECT_DIGITS:
+                return
+            data = _loads(message)
+            try:
+                order = data['o']
+                qty_str = order['q']
+                price_str = order['p']
+                if below_generic_threshold(qty_str, price_str):
+                    return
+                symbol = order['s']
+                side = order['S']
+                qty = float(qty_str)
+                price = float(price_str)
+            except (KeyError, ValueError):
+                return
 
-            if not all([symbol, side, qty, price]):
+            value = qty * price
+            if value < GENERIC_THRESHOLD:
                 return
 
             # Apply filter rules
-            if symbol in TRACKED_SYMBOLS and value >= 1_000_000:
-                alert = base_format(symbol, side, value, price, "🔶 Binance")
-                print(f"🚨 Binance Special: {symbol} ${value:,.2f}")
-                send_telegram(alert)
-            elif value >= 500_000:
-                alert = generic_format(symbol, side, value, price, "🔶 Binance")
-                print(f"🚨 Binance Generic: {symbol} ${value:,.2f}")
-                send_telegram(alert)
+            if symbol in TRACKED_SYMBOLS and value >= SPECIAL_THRESHOLD:
+                alert = base_format(symbol, side, value, price, BINANCE_TAG)
+                logger.info(f"🚨 Binance Special: {symbol} ${value:,.2f}")
+            else:
+                alert = generic_format(symbol, side, value, price, BINANCE_TAG)
+                logger.info(f"🚨 Binance Generic: {symbol} ${value:,.2f}")
+            send_telegram(alert)
 
         except Exception as e:
-            print(f"❌ Binance error: {e}")
+            logger.error(f"❌ Binance error: {e}")
 
     def on_error(self, ws, error):
-        print(f"❌ Binance WebSocket error: {error}")
+        logger.error(f"❌ Binance WebSocket error: {error}")
 
     def on_close(self, ws, close_status_code, close_msg):
-        print(f"⚠️ Binance connection closed: {close_status_code}")
-        if self.running and self.reconnect_count < self.max_reconnect_attempts:
-            self.reconnect_count += 1
-            print(f"🔄 Binance reconnecting... ({self.reconnect_count}/{self.max_reconnect_attempts})")
-            time.sleep(5)  # Wait 5 seconds before reconnecting
-            self.start()
+        logger.warning(f"⚠️ Binance connection closed: {close_status_code}")
 
     def on_open(self, ws):
-        print("🟢 Binance connected")
+        logger.info("🟢 Binance connected")
         self.reconnect_count = 0  # Reset reconnect counter on successful connection
 
     def start(self):
         self.running = True
-        self.ws = websocket.WebSocketApp(
-            "wss://fstream.binance.com/ws/!forceOrder@arr",
-            on_open=self.on_open,
-            on_message=self.on_message,
-            on_error=self.on_error,
-            on_close=self.on_close
-        )
-        
-        # Ping thread to maintain connection
-        def ping_loop():
-            while self.running:
-                time.sleep(30)
-                try:
-                    if self.ws and hasattr(self.ws, 'sock') and self.ws.sock:
-                        self.ws.sock.ping()
-                        print("💓 Binance ping")
-                except:
-                    break
-        
-        threading.Thread(target=ping_loop, daemon=True).start()
-        self.ws.run_forever()
+        while self.running:
+            self.ws = websocket.WebSocketApp(
+                "wss://fstream.binance.com/ws/!forceOrder@arr",
+                on_open=self.on_open,
+                on_message=self.on_message,
+                on_error=self.on_error,
+                on_close=self.on_close
+            )
+            
+            # websocket-client owns the keepalive: it starts its own ping thread
+            # per connection and drops it if no pong arrives within ping_timeout
+            self.ws.run_forever(ping_interval=30, ping_timeout=10, skip_utf8_validation=True)
+            
+            if not self.running or self.reconnect_count >= self.max_reconnect_attempts:
+                break
+            self.reconnect_count += 1
+            delay = reconnect_delay(self.reconnect_count)
+            logger.info(f"🔄 Binance reconnecting in {delay}s... ({self.reconnect_count}/{self.max_reconnect_attempts})")
+            time.sleep(delay)
 
 class BybitMonitor:
+    __slots__ = ('ws', 'running', 'reconnect_count', 'max_reconnect_attempts',
+                 'last_ping_time', 'connection_alive')
+
     def __init__(self):
         self.ws = None
         self.running = False
@@ -307,124 +501,110 @@ class BybitMonitor:
         self.last_ping_time = 0
         self.connection_alive = False
 
-    def on_message(self, ws, message):
+    def on_message(self, ws, message: bytes) -> None:
         try:
-            data = json.loads(message)
-            
             # Update connection status on any message
             self.connection_alive = True
             self.last_ping_time = time.time()
+
+            # Skip the decode when every item in the frame is too small;
+            # only if each "v" field matched, otherwise decode as usual
+            raw = _BYBIT_VP_RE.findall(message)
+            if (raw and len(raw) == message.count(b'"v":"') and
+                    all(len(v) + len(p) <= _MAX_REJECT_DIGITS for v, p in raw)):
+                return
+            data = _loads(message)
             
             if 'success' in data and data.get('op') == 'subscribe':
-                print(f"✅ Bybit subscription confirmed")
-                
-            elif data.get('op') == 'pong':
-                print("💓 Bybit pong received")
+                logger.info(f"✅ Bybit subscription confirmed")
                 
             elif 'topic' in data and data['topic'].startswith('allLiquidation'):
-                for liq_data in data.get('data', []):
-                    symbol = liq_data.get('s', '')
-                    side = liq_data.get('S', '')
-                    size = float(liq_data.get('v', 0))
-                    price = float(liq_data.get('p', 0))
+                for liq_data in data.get('data', ()):
+                    try:
+                        size_str = liq_data['v']
+                        price_str = liq_data['p']
+                        if below_generic_threshold(size_str, price_str):
+                            continue
+                        symbol = liq_data['s']
+                        side = liq_data['S']
+                        size = float(size_str)
+                        price = float(price_str)
+                    except (KeyError, ValueError):
+                        continue
+
                     value = size * price
-                    
+                    if value < GENERIC_THRESHOLD:
+                        continue
+
                     # Apply filter rules
-                    if symbol in TRACKED_SYMBOLS and value >= 1_000_000:
-                        alert = base_format(symbol, side, value, price, "🟨 Bybit")
-                        print(f"🚨 Bybit Special: {symbol} ${value:,.2f}")
-                        send_telegram(alert)
-                    elif value >= 500_000:
-                        alert = generic_format(symbol, side, value, price, "🟨 Bybit")
-                        print(f"🚨 Bybit Generic: {symbol} ${value:,.2f}")
-                        send_telegram(alert)
+                    if symbol in TRACKED_SYMBOLS and value >= SPECIAL_THRESHOLD:
+                        alert = base_format(symbol, side, value, price, BYBIT_TAG)
+                        logger.info(f"🚨 Bybit Special: {symbol} ${value:,.2f}")
+                    else:
+                        alert = generic_format(symbol, side, value, price, BYBIT_TAG)
+                        logger.info(f"🚨 Bybit Generic: {symbol} ${value:,.2f}")
+                    send_telegram(alert)
                         
         except Exception as e:
-            print(f"❌ Bybit error: {e}")
+            logger.error(f"❌ Bybit error: {e}")
 
     def on_error(self, ws, error):
-        print(f"❌ Bybit WebSocket error: {error}")
+        logger.error(f"❌ Bybit WebSocket error: {error}")
 
     def on_close(self, ws, close_status_code, close_msg):
-        print(f"⚠️ Bybit connection closed: {close_status_code}")
+        logger.warning(f"⚠️ Bybit connection closed: {close_status_code}")
         self.connection_alive = False
-        if self.running and self.reconnect_count < self.max_reconnect_attempts:
-            self.reconnect_count += 1
-            print(f"🔄 Bybit reconnecting... ({self.reconnect_count}/{self.max_reconnect_attempts})")
-            time.sleep(5)  # Wait 5 seconds before reconnecting
-            self.start()
+
+    def on_pong(self, ws, data):
+        # Keepalive pongs count as traffic for is_healthy()
+        self.connection_alive = True
+        self.last_ping_time = time.time()
 
     def on_open(self, ws):
-        print("🟢 Bybit connected")
+        logger.info("🟢 Bybit connected")
         self.reconnect_count = 0  # Reset reconnect counter on successful connection
         self.connection_alive = True
         self.last_ping_time = time.time()
         
-        # Subscribe to all symbols (to capture liquidations >500k)
-        bybit_symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "ADAUSDT", "DOGEUSDT", "XRPUSDT", "AVAXUSDT", "DOTUSDT", "MATICUSDT", "LINKUSDT"]
-        args = [f"allLiquidation.{s}" for s in bybit_symbols]
+        # Subscribe to the tracked symbols only
+        args = [f"allLiquidation.{s}" for s in BYBIT_SYMBOLS]
         subscribe_msg = {"op": "subscribe", "args": args}
-        ws.send(json.dumps(subscribe_msg))
-        print(f"🔔 Bybit subscribed to: {bybit_symbols}")
+        ws.send(_dumps(subscribe_msg).decode())
+        logger.info(f"🔔 Bybit subscribed to: {BYBIT_SYMBOLS}")
 
     def start(self):
         self.running = True
-        self.ws = websocket.WebSocketApp(
-            "wss://stream.bybit.com/v5/public/linear",
-            on_open=self.on_open,
-            on_message=self.on_message,
-            on_error=self.on_error,
-            on_close=self.on_close
-        )
-        
-        # Enhanced ping and connection monitoring thread
-        def enhanced_monitoring_loop():
-            while self.running:
-                time.sleep(30)
-                current_time = time.time()
-                
-                try:
-                    # Check if connection is still alive
-                    if self.ws and hasattr(self.ws, 'sock') and self.ws.sock:
-                        # Send ping
-                        self.ws.send(json.dumps({"op": "ping"}))
-                        print("💓 Bybit ping")
-                        
-                        # Check if we haven't received any message in the last 2 minutes
-                        if current_time - self.last_ping_time > 120:
-                            print("⚠️ Bybit: No response for 2 minutes, connection may be dead")
-                            self.connection_alive = False
-                            
-                            # Force reconnection
-                            if self.ws and hasattr(self.ws, 'sock'):
-                                try:
-                                    self.ws.close()
-                                except:
-                                    pass
-                            break
-                    else:
-                        print("⚠️ Bybit: WebSocket connection lost")
-                        self.connection_alive = False
-                        break
-                        
-                except Exception as e:
-                    print(f"❌ Bybit monitoring error: {e}")
-                    self.connection_alive = False
-                    break
-        
-        threading.Thread(target=enhanced_monitoring_loop, daemon=True).start()
-        self.ws.run_forever()
+        while self.running:
+            self.ws = websocket.WebSocketApp(
+                "wss://stream.bybit.com/v5/public/linear",
+                on_open=self.on_open,
+                on_message=self.on_message,
+                on_error=self.on_error,
+                on_close=self.on_close,
+                on_pong=self.on_pong
+            )
+            
+            # websocket-client owns the keepalive: it starts its own ping thread
+            # per connection and drops it if no pong arrives within ping_timeout
+            self.ws.run_forever(ping_interval=20, ping_timeout=10, skip_utf8_validation=True)
+            
+            if not self.running or self.reconnect_count >= self.max_reconnect_attempts:
+                break
+            self.reconnect_count += 1
+            delay = reconnect_delay(self.reconnect_count)
+            logger.info(f"🔄 Bybit reconnecting in {delay}s... ({self.reconnect_count}/{self.max_reconnect_attempts})")
+            time.sleep(delay)
     
     def force_reconnect(self):
         """Force a reconnection if the current connection seems dead"""
-        print("🔄 Bybit: Forcing reconnection...")
+        logger.info("🔄 Bybit: Forcing reconnection...")
         self.connection_alive = False
         if self.ws:
             try:
                 self.ws.close()
             except:
                 pass
-        # The on_close handler will trigger automatic reconnection
+        # start() reconnects once run_forever() returns
     
     def is_healthy(self):
         """Check if the connection is healthy"""
@@ -437,7 +617,8 @@ class BybitMonitor:
 
 class HyperliquidMonitor:
     """Monitor Hyperliquid Liquidations Telegram channel"""
-    
+    __slots__ = ('client', 'running')
+
     def __init__(self):
         self.client = None
         self.running = False
@@ -445,56 +626,60 @@ class HyperliquidMonitor:
     async def setup_client(self):
         """Setup Telegram client with proper imports and error handling"""
         try:
-            print("🔍 Hyperliquid: Tentando importar telethon...")
+            logger.info("🔍 Hyperliquid: Tentando importar telethon...")
             import sys
-            print(f"🔍 Python path: {sys.path}")
+            logger.info(f"🔍 Python path: {sys.path}")
             
             try:
                 import telethon
-                print(f"✅ Telethon importado: {telethon.__version__}")
+                logger.info(f"✅ Telethon importado: {telethon.__version__}")
             except ImportError as ie:
-                print(f"❌ Erro importando telethon: {ie}")
+                logger.error(f"❌ Erro importando telethon: {ie}")
                 return False
             
             from telethon import TelegramClient
-            print("✅ TelegramClient importado com sucesso")
+            from telethon.network import ConnectionTcpAbridged
+            logger.info("✅ TelegramClient importado com sucesso")
             
             if not TELEGRAM_API_ID or not TELEGRAM_API_HASH:
-                print("❌ Hyperliquid: Missing TELEGRAM_API_ID or TELEGRAM_API_HASH in .env")
-                print(f"🔍 API_ID: {'✅' if TELEGRAM_API_ID else '❌'}")
-                print(f"🔍 API_HASH: {'✅' if TELEGRAM_API_HASH else '❌'}")
+                logger.error("❌ Hyperliquid: Missing TELEGRAM_API_ID or TELEGRAM_API_HASH in .env")
+                logger.error(f"🔍 API_ID: {'✅' if TELEGRAM_API_ID else '❌'}")
+                logger.error(f"🔍 API_HASH: {'✅' if TELEGRAM_API_HASH else '❌'}")
                 return False
                 
-            print(f"🔍 Usando API_ID: {TELEGRAM_API_ID[:5]}...")
-            print(f"🔍 Usando API_HASH: {TELEGRAM_API_HASH[:5]}...")
+            logger.info(f"🔍 Usando API_ID: {TELEGRAM_API_ID[:5]}...")
+            logger.info(f"🔍 Usando API_HASH: {TELEGRAM_API_HASH[:5]}...")
                 
             # Use session file that should be created by previous authentication
             session_name = 'hyperliquid_session'
-            self.client = TelegramClient(session_name, TELEGRAM_API_ID, TELEGRAM_API_HASH)
+            self.client = TelegramClient(
+                session_name, TELEGRAM_API_ID, TELEGRAM_API_HASH,
+                connection=ConnectionTcpAbridged  # 1-byte length prefix for small frames
+            )
             
             # Try to start with existing session or interactive auth
             try:
                 # For manual execution, allow interactive auth
                 import sys
                 if sys.stdin.isatty():  # Running interactively (not via PM2)
-                    print("🔄 Hyperliquid: Iniciando autenticação interativa...")
+                    logger.info("🔄 Hyperliquid: Iniciando autenticação interativa...")
                     await self.client.start()
-                    print("🟢 Hyperliquid Telegram client connected (interactive)")
+                    logger.info("🟢 Hyperliquid Telegram client connected (interactive)")
                     return True
                 else:
                     # For PM2, try non-interactive
                     await self.client.connect()
                     if await self.client.is_user_authorized():
-                        print("🟢 Hyperliquid Telegram client connected (existing session)")
+                        logger.info("🟢 Hyperliquid Telegram client connected (existing session)")
                         return True
                     else:
-                        print("❌ Hyperliquid: Sessão não autorizada")
-                        print("💡 Execute 'python integrated_monitor.py' diretamente primeiro para autenticar")
+                        logger.error("❌ Hyperliquid: Sessão não autorizada")
+                        logger.info("💡 Execute 'python integrated_monitor.py' diretamente primeiro para autenticar")
                         await self.client.disconnect()
                         return False
             except Exception as auth_error:
-                print(f"❌ Erro de autenticação: {auth_error}")
-                print("💡 Execute 'python integrated_monitor.py' diretamente primeiro para autenticar")
+                logger.error(f"❌ Erro de autenticação: {auth_error}")
+                logger.info("💡 Execute 'python integrated_monitor.py' diretamente primeiro para autenticar")
                 try:
                     await self.client.disconnect()
                 except:
@@ -502,37 +687,35 @@ class HyperliquidMonitor:
                 return False
             
         except ImportError as ie:
-            print(f"❌ Hyperliquid: telethon not installed. Run: pip install telethon")
-            print(f"❌ Erro detalhado: {ie}")
+            logger.error(f"❌ Hyperliquid: telethon not installed. Run: pip install telethon")
+            logger.error(f"❌ Erro detalhado: {ie}")
             return False
         except Exception as e:
-            print(f"❌ Hyperliquid setup error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Hyperliquid setup error: {e}")
             return False
     
     async def handle_new_message(self, event):
         """Process new messages from Hyperliquid channel"""
         try:
-            print(f"🎯 Hyperliquid: Event handler chamado!")
-            print(f"🔍 Event type: {type(event)}")
+            logger.info(f"🎯 Hyperliquid: Event handler chamado!")
+            logger.info(f"🔍 Event type: {type(event)}")
             
             message_text = event.message.message
-            print(f"🔍 Hyperliquid: Nova mensagem recebida: {message_text[:100]}...")
+            logger.info(f"🔍 Hyperliquid: Nova mensagem recebida: {message_text[:100]}...")
             
             if not message_text:
-                print("⚠️ Hyperliquid: Mensagem vazia")
+                logger.warning("⚠️ Hyperliquid: Mensagem vazia")
                 return
                 
             # Parse liquidation message
             parsed = parse_hyperliquid_message(message_text)
             if parsed:
-                print(f"✅ Hyperliquid: Mensagem parseada: {parsed}")
+                logger.info(f"✅ Hyperliquid: Mensagem parseada: {parsed}")
                 
                 # Apply filter: only show liquidations >= $1M
                 value = parsed['value']
                 if value < 1_000_000:
-                    print(f"❌ Hyperliquid: Liquidação filtrada (${value:,.2f} < $1M)")
+                    logger.info(f"❌ Hyperliquid: Liquidação filtrada (${value:,.2f} < $1M)")
                     return
                 
                 # Format message in our style
@@ -543,43 +726,41 @@ class HyperliquidMonitor:
                 
                 # Log the activity
                 symbol = parsed['symbol']
-                print(f"🚨 Hyperliquid: {symbol} ${value:,.2f}")
+                logger.info(f"🚨 Hyperliquid: {symbol} ${value:,.2f}")
             else:
-                print(f"❌ Hyperliquid: Não foi possível parsear: {message_text}")
+                logger.error(f"❌ Hyperliquid: Não foi possível parsear: {message_text}")
                 
         except Exception as e:
-            print(f"❌ Hyperliquid message error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Hyperliquid message error: {e}")
     
     async def start_monitoring(self):
         """Start monitoring the Hyperliquid channel"""
         try:
-            print("🔄 Hyperliquid: Iniciando setup do client...")
+            logger.info("🔄 Hyperliquid: Iniciando setup do client...")
             if not await self.setup_client():
-                print("❌ Hyperliquid: Falha no setup do client")
+                logger.error("❌ Hyperliquid: Falha no setup do client")
                 return
                 
-            print(f"🔍 Hyperliquid: Tentando acessar canal: {HYPERLIQUID_CHANNEL}")
+            logger.info(f"🔍 Hyperliquid: Tentando acessar canal: {HYPERLIQUID_CHANNEL}")
                 
             # Get the channel entity - try different formats
             try:
                 # Try with @ prefix
                 channel = await self.client.get_entity(f"@{HYPERLIQUID_CHANNEL}")
-                print(f"✅ Hyperliquid: Canal encontrado com @: @{HYPERLIQUID_CHANNEL}")
+                logger.info(f"✅ Hyperliquid: Canal encontrado com @: @{HYPERLIQUID_CHANNEL}")
             except:
                 try:
                     # Try without @ prefix
                     channel = await self.client.get_entity(HYPERLIQUID_CHANNEL)
-                    print(f"✅ Hyperliquid: Canal encontrado sem @: {HYPERLIQUID_CHANNEL}")
+                    logger.info(f"✅ Hyperliquid: Canal encontrado sem @: {HYPERLIQUID_CHANNEL}")
                 except:
                     # Try with t.me link
                     channel = await self.client.get_entity("https://t.me/hyperliquid_liquidations")
-                    print(f"✅ Hyperliquid: Canal encontrado via link")
+                    logger.info(f"✅ Hyperliquid: Canal encontrado via link")
             
-            print(f"📡 Hyperliquid: Monitorando canal: {channel.title}")
-            print(f"🔍 Canal ID: {channel.id}")
-            print(f"🔍 Canal username: {getattr(channel, 'username', 'N/A')}")
+            logger.info(f"📡 Hyperliquid: Monitorando canal: {channel.title}")
+            logger.info(f"🔍 Canal ID: {channel.id}")
+            logger.info(f"🔍 Canal username: {getattr(channel, 'username', 'N/A')}")
             
             # Add event handler for new messages
             from telethon import events
@@ -588,92 +769,82 @@ class HyperliquidMonitor:
                 events.NewMessage(chats=channel)
             )
             
-            print("🎯 Hyperliquid: Event handler adicionado")
+            logger.info("🎯 Hyperliquid: Event handler adicionado")
             
-            # Test: Get some recent messages to see format
-            print("🔍 Hyperliquid: Verificando mensagens recentes...")
-            message_count = 0
-            async for message in self.client.iter_messages(channel, limit=10):
-                if message.message:
-                    message_count += 1
-                    print(f"📝 Mensagem {message_count}: {message.message[:150]}...")
-                    # Test parsing
-                    test_parsed = parse_hyperliquid_message(message.message)
-                    if test_parsed:
-                        print(f"✅ Parse OK: {test_parsed}")
-                    else:
-                        print("❌ Parse falhou")
+            # Debug: parse some recent messages to check the format
+            if os.getenv('MONITOR_DEBUG_HISTORY') == '1':
+                logger.info("🔍 Hyperliquid: Verificando mensagens recentes...")
+                message_count = 0
+                async for message in self.client.iter_messages(channel, limit=10):
+                    if message.message:
+                        message_count += 1
+                        logger.info(f"📝 Mensagem {message_count}: {message.message[:150]}...")
+                        # Test parsing
+                        test_parsed = parse_hyperliquid_message(message.message)
+                        if test_parsed:
+                            logger.info(f"✅ Parse OK: {test_parsed}")
+                        else:
+                            logger.error("❌ Parse falhou")
                         
-            print(f"📊 Total de mensagens recentes encontradas: {message_count}")
+                logger.info(f"📊 Total de mensagens recentes encontradas: {message_count}")
             
             # Keep the client running
             self.running = True
-            print("🚀 Hyperliquid: Client ativo, aguardando mensagens...")
-            
-            # Add periodic check to verify we're still connected
-            async def periodic_check():
-                while self.running:
-                    try:
-                        await asyncio.sleep(60)  # Check every minute
-                        if self.client and self.client.is_connected():
-                            print("💓 Hyperliquid: Client conectado, aguardando...")
-                        else:
-                            print("⚠️ Hyperliquid: Client desconectado!")
-                    except Exception as e:
-                        print(f"❌ Hyperliquid periodic check error: {e}")
-            
-            # Start periodic check
-            asyncio.create_task(periodic_check())
+            logger.info("🚀 Hyperliquid: Client ativo, aguardando mensagens...")
             
             await self.client.run_until_disconnected()
+            self.running = False
+            logger.warning("⚠️ Hyperliquid: Client desconectado!")
             
         except Exception as e:
-            print(f"❌ Hyperliquid monitoring error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Hyperliquid monitoring error: {e}")
     
     def start(self):
         """Start monitoring in asyncio loop"""
         try:
             # Run the async monitoring
-            asyncio.run(self.start_monitoring())
+            run_async(self.start_monitoring())
         except Exception as e:
-            print(f"❌ Hyperliquid start error: {e}")
+            logger.error(f"❌ Hyperliquid start error: {e}")
 
 async def setup_hyperliquid_auth():
     """Setup Hyperliquid authentication interactively if needed"""
     import sys
     if sys.stdin.isatty():  # Running interactively
-        print("🔄 Verificando autenticação da Hyperliquid...")
+        logger.info("🔄 Verificando autenticação da Hyperliquid...")
         hyperliquid_monitor = HyperliquidMonitor()
         success = await hyperliquid_monitor.setup_client()
         if success:
-            print("✅ Hyperliquid autenticada com sucesso!")
+            logger.info("✅ Hyperliquid autenticada com sucesso!")
             await hyperliquid_monitor.client.disconnect()
             return True
         else:
-            print("❌ Falha na autenticação da Hyperliquid")
+            logger.error("❌ Falha na autenticação da Hyperliquid")
             return False
     return True  # Skip for non-interactive (PM2)
 
 def main():
-    print("🚀 Starting Integrated Monitor...")
-    print(f"📊 Special Symbols: {TRACKED_SYMBOLS} (≥$1M)")
-    print(f"💰 Generic Threshold: ≥$500k")
-    print(f"📡 Hyperliquid Channel: @{HYPERLIQUID_CHANNEL} (≥$1M)")
+    setup_logging()
+    logger.info("🚀 Starting Integrated Monitor...")
+    logger.info(f"📊 Special Symbols: {', '.join(sorted(TRACKED_SYMBOLS))} (≥$1M)")
+    logger.info(f"💰 Generic Threshold: ≥$500k (Binance only; Bybit covers {', '.join(BYBIT_SYMBOLS)})")
+    logger.info(f"📡 Hyperliquid Channel: @{HYPERLIQUID_CHANNEL} (≥$1M)")
     
-    # Test Hyperliquid parsing first
-    test_hyperliquid_parsing()
+    # Parser/frame self-tests, opt-in with MONITOR_SELFTEST=1
+    if os.getenv('MONITOR_SELFTEST') == '1':
+        test_hyperliquid_parsing()
+        test_exchange_frames()
     
     # Setup Hyperliquid authentication if running interactively
     import sys
     if sys.stdin.isatty():
-        print("\n🔐 Configurando autenticação da Hyperliquid...")
-        asyncio.run(setup_hyperliquid_auth())
-        print("\n✅ Autenticação concluída. Iniciando monitores...\n")
+        logger.info("\n🔐 Configurando autenticação da Hyperliquid...")
+        run_async(setup_hyperliquid_auth())
+        logger.info("\n✅ Autenticação concluída. Iniciando monitores...\n")
     
     # Send startup message
-    start_msg = f"🚀 *Integrated Monitor Active*\n📊 BTC, ETH, SOL: ≥$1M\n💰 Others: ≥$500k\n📡 Hyperliquid: ≥$1M"
+    start_telegram_sender()
+    start_msg = f"🚀 *Integrated Monitor Active*\n📊 BTC, ETH, SOL: ≥$1M\n💰 Other Binance symbols: ≥$500k\n📡 Hyperliquid: ≥$1M"
     send_telegram(start_msg)
     
     # Start monitors in separate threads
@@ -690,46 +861,41 @@ def main():
     hyperliquid_thread.start()
     
     try:
-        # Enhanced monitoring loop with health checks
-        health_check_counter = 0
+        # Sleep until the next health check; nothing else needs to wake
+        # the main thread, and Ctrl+C still interrupts the sleep
         while True:
-            time.sleep(60)
-            health_check_counter += 1
-            print("💓 Monitor alive")
+            time.sleep(HEALTH_CHECK_INTERVAL)
+            logger.info("💓 Monitor alive")
+            logger.info("🔍 Performing health checks...")
             
-            # Perform health checks every 5 minutes
-            if health_check_counter >= 5:
-                health_check_counter = 0
-                print("🔍 Performing health checks...")
-                
-                # Check Bybit health
-                if hasattr(bybit_monitor, 'is_healthy') and not bybit_monitor.is_healthy():
-                    print("⚠️ Bybit connection appears unhealthy, forcing reconnection...")
-                    try:
-                        bybit_monitor.force_reconnect()
-                    except Exception as e:
-                        print(f"❌ Error forcing Bybit reconnection: {e}")
-                else:
-                    print("✅ Bybit connection healthy")
-                
-                # Check if threads are still alive
-                if not binance_thread.is_alive():
-                    print("⚠️ Binance thread died, restarting...")
-                    binance_thread = threading.Thread(target=binance_monitor.start, daemon=True)
-                    binance_thread.start()
-                
-                if not bybit_thread.is_alive():
-                    print("⚠️ Bybit thread died, restarting...")
-                    bybit_thread = threading.Thread(target=bybit_monitor.start, daemon=True)
-                    bybit_thread.start()
+            # Check Bybit health
+            if hasattr(bybit_monitor, 'is_healthy') and not bybit_monitor.is_healthy():
+                logger.warning("⚠️ Bybit connection appears unhealthy, forcing reconnection...")
+                try:
+                    bybit_monitor.force_reconnect()
+                except Exception as e:
+                    logger.error(f"❌ Error forcing Bybit reconnection: {e}")
+            else:
+                logger.info("✅ Bybit connection healthy")
+            
+            # Check if threads are still alive
+            if not binance_thread.is_alive():
+                logger.warning("⚠️ Binance thread died, restarting...")
+                binance_thread = threading.Thread(target=binance_monitor.start, daemon=True)
+                binance_thread.start()
+            
+            if not bybit_thread.is_alive():
+                logger.warning("⚠️ Bybit thread died, restarting...")
+                bybit_thread = threading.Thread(target=bybit_monitor.start, daemon=True)
+                bybit_thread.start()
+            
+            if not hyperliquid_thread.is_alive():
+                logger.warning("⚠️ Hyperliquid thread died, restarting...")
+                hyperliquid_thread = threading.Thread(target=hyperliquid_monitor.start, daemon=True)
+                hyperliquid_thread.start()
                 
-                if not hyperliquid_thread.is_alive():
-                    print("⚠️ Hyperliquid thread died, restarting...")
-                    hyperliquid_thread = threading.Thread(target=hyperliquid_monitor.start, daemon=True)
-                    hyperliquid_thread.start()
-                    
     except KeyboardInterrupt:
-        print("🛑 Stopping monitors...")
+        logger.info("🛑 Stopping monitors...")
         binance_monitor.running = False
         bybit_monitor.running = False
         hyperliquid_monitor.running = False
@@ -6,21 +6,12 @@ Run this once to create the session file
 """
 
 import os
-import asyncio
-from telethon import TelegramClient
 
-# Load environment variables
-def load_env_file():
-    try:
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-    except FileNotFoundError:
-        print("Warning: .env file not found")
+from env_utils import load_env_file
+from tg_client import get_client, run_async
 
-load_env_file()
+# Load environment variables
+load_env_file(required=('TELEGRAM_API_ID', 'TELEGRAM_API_HASH'))
 
 async def setup_auth():
     """Setup Telegram authentication"""
@@ -36,8 +27,8 @@ async def setup_auth():
     print("🔑 Digite sua senha 2FA se tiver ativada")
     
     try:
-        # Create client with session
-        client = TelegramClient('hyperliquid_session', TELEGRAM_API_ID, TELEGRAM_API_HASH)
+        # Always the on-disk session: this script is what creates the file
+        client = await get_client(string_session=False)
         
         # Start client (this will prompt for authentication)
         await client.start()
@@ -50,10 +41,16 @@ async def setup_auth():
         me = await client.get_me()
         print(f"👤 Conectado como: {me.first_name} (@{me.username})")
         
+        # Opt-in: the string grants full account access, keep it out of logs
+        if os.getenv('TG_PRINT_SESSION') == '1':
+            from telethon.sessions import StringSession
+            print("🔑 TG_SESSION para os scripts de teste:")
+            print(StringSession.save(client.session))
+        
         await client.disconnect()
         
     except Exception as e:
         print(f"❌ Erro na autenticação: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(setup_auth()) 
\ No newline at end of file
+    run_async(setup_auth()) 
\ No newline at end of file
@@ -5,21 +5,11 @@ Test script to check Hyperliquid channel access
 """
 
 import os
-import asyncio
-from telethon import TelegramClient
 
-# Load environment variables
-def load_env_file():
-    try:
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-    except FileNotFoundError:
-        print("Warning: .env file not found")
-
-load_env_file()
+# Importing the monitor also loads .env (unconditionally, since it reads
+# optional settings from it), so no separate load_env_file() call here
+from integrated_monitor import parse_hyperliquid_message
+from tg_client import SESSION_NAME, get_client, run_async
 
 async def test_channel_access():
     """Test access to Hyperliquid channel"""
@@ -30,12 +20,19 @@ async def test_channel_access():
         print("❌ Credenciais não encontradas")
         return
     
+    if not os.getenv('TG_SESSION') and not os.path.exists(f"{SESSION_NAME}.session"):
+        print("❌ Sessão não encontrada, execute setup_telegram_auth.py primeiro")
+        return
+    
     print("🔍 Testando acesso ao canal Hyperliquid...")
     
     try:
-        # Create client
-        client = TelegramClient('test_session', TELEGRAM_API_ID, TELEGRAM_API_HASH)
-        await client.start()
+        # Reuse the monitor's authorized session
+        client = await get_client()
+        if not await client.is_user_authorized():
+            print("❌ Sessão não autorizada, execute setup_telegram_auth.py primeiro")
+            await client.disconnect()
+            return
         print("✅ Client conectado")
         
         # Try to access channel
@@ -62,22 +59,24 @@ async def test_channel_access():
         # Get recent messages
         print("\n📝 Últimas 5 mensagens:")
         message_count = 0
-        async for message in client.iter_messages(channel, limit=5):
+        out = []  # Report lines, written in one go after the loop
+        # One GetHistory request; parsing 5 short messages needs no concurrency
+        for message in await client.get_messages(channel, limit=5):
             if message.message:
                 message_count += 1
-                print(f"\n--- Mensagem {message_count} ---")
-                print(f"📅 Data: {message.date}")
-                print(f"📝 Texto: {message.message[:200]}...")
+                out.append(f"\n--- Mensagem {message_count} ---")
+                out.append(f"📅 Data: {message.date}")
+                out.append(f"📝 Texto: {message.message[:200]}...")
                 
                 # Test our parsing
-                from integrated_monitor import parse_hyperliquid_message
                 parsed = parse_hyperliquid_message(message.message)
                 if parsed:
-                    print(f"✅ Parse OK: {parsed}")
+                    out.append(f"✅ Parse OK: {parsed}")
                 else:
-                    print("❌ Parse falhou")
+                    out.append("❌ Parse falhou")
         
-        print(f"\n📊 Total de mensagens encontradas: {message_count}")
+        out.append(f"\n📊 Total de mensagens encontradas: {message_count}")
+        print("\n".join(out))
         
         await client.disconnect()
         print("✅ Teste concluído")
@@ -88,4 +87,4 @@ async def test_channel_access():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test_channel_access()) 
\ No newline at end of file
+    run_async(test_channel_access()) 
\ No newline at end of file
@@ -4,41 +4,20 @@
 Test script for telethon import and basic functionality
 """
 
+import importlib.util
 import os
 import sys
 
+from env_utils import load_env_file
+
 # Load environment variables
-def load_env_file():
-    try:
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-    except FileNotFoundError:
-        print("Warning: .env file not found")
-
-load_env_file()
+load_env_file(required=('TELEGRAM_API_ID', 'TELEGRAM_API_HASH'))
 
 print("🧪 Testando importação do telethon...")
 print(f"🔍 Python version: {sys.version}")
 print(f"🔍 Python path: {sys.executable}")
 
-try:
-    import telethon
-    print(f"✅ Telethon importado: {telethon.__version__}")
-except ImportError as e:
-    print(f"❌ Erro importando telethon: {e}")
-    sys.exit(1)
-
-try:
-    from telethon import TelegramClient
-    print("✅ TelegramClient importado com sucesso")
-except ImportError as e:
-    print(f"❌ Erro importando TelegramClient: {e}")
-    sys.exit(1)
-
-# Check credentials
+# Check credentials first so a bad .env fails before the telethon import
 TELEGRAM_API_ID = os.getenv('TELEGRAM_API_ID')
 TELEGRAM_API_HASH = os.getenv('TELEGRAM_API_HASH')
 
@@ -49,5 +28,26 @@ if not TELEGRAM_API_ID or not TELEGRAM_API_HASH:
     print("❌ Credenciais não encontradas no .env")
     sys.exit(1)
 
+# Locate the packages without importing them
+if importlib.util.find_spec('telethon') is None:
+    print("❌ telethon não instalado. Run: pip install telethon")
+    sys.exit(1)
+
+# Optional C backend for MTProto AES-IGE; Telethon picks it up automatically
+if importlib.util.find_spec('cryptg') is not None:
+    print("✅ cryptg disponível (criptografia acelerada)")
+else:
+    print("⚠️ cryptg não instalado, Telethon usa AES em Python puro (pip install cryptg)")
+
+# Only now pay for the full TL import graph
+try:
+    import telethon
+    from telethon import TelegramClient
+    print(f"✅ Telethon importado: {telethon.__version__}")
+    print("✅ TelegramClient importado com sucesso")
+except ImportError as e:
+    print(f"❌ Erro importando telethon: {e}")
+    sys.exit(1)
+
 print("✅ Todas as verificações passaram!")
-print("🚀 Telethon está funcionando corretamente")
\ No newline at end of file
+print("🚀 Telethon está funcionando corretamente")
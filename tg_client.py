@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared Telethon client and event-loop runner for the monitor and helper scripts
+"""
+
+import asyncio
+import os
+
+# Optional libuv-based event loop for Telethon
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+SESSION_NAME = 'hyperliquid_session'
+
+_clients = {}
+
+def run_async(main):
+    """asyncio.run() on a uvloop loop when uvloop is installed"""
+    if uvloop is None:
+        return asyncio.run(main)
+    return uvloop.run(main)  # uvloop >= 0.18; unlike asyncio.Runner, works before 3.11
+
+async def get_client(session_name=SESSION_NAME, string_session=True):
+    """Return the process-wide connected client for a session, creating it on first use"""
+    # Imported here so run_async() works without telethon installed
+    from telethon import TelegramClient
+    from telethon.network import ConnectionTcpAbridged
+    from telethon.sessions import StringSession
+
+    client = _clients.get(session_name)
+    if client is None:
+        session = session_name
+        # Optional in-memory session (StringSession.save() output) replacing
+        # the SQLite file; read here so a value loaded from .env is seen
+        tg_session = os.getenv('TG_SESSION')
+        if string_session and tg_session and session_name == SESSION_NAME:
+            session = StringSession(tg_session)
+        client = _clients[session_name] = TelegramClient(
+            session,
+            os.getenv('TELEGRAM_API_ID'),
+            os.getenv('TELEGRAM_API_HASH'),
+            connection=ConnectionTcpAbridged  # 1-byte length prefix for small frames
+        )
+    if not client.is_connected():
+        await client.connect()
+    return client